@@ -3,12 +3,7 @@ Gmail LLM Connector Package.
 A modular Gmail API connector with encrypted credential support.
 """
 
-from .core.gmail_connector import GmailConnector
-from .auth.oauth_manager import OAuthManager
-from .auth.encrypted_oauth_manager import EncryptedOAuthManager
-from .email.message_reader import MessageReader
-from .email.message_sender import MessageSender
-from .security.credential_manager import CredentialManager
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Gmail LLM Connector"
@@ -20,4 +15,24 @@ __all__ = [
     "MessageReader",
     "MessageSender",
     "CredentialManager"
-]
\ No newline at end of file
+]
+
+# Public classes are imported on first access so that light entry points
+# (config, CLI helpers) don't pay for the Google API client at import time.
+_LAZY_IMPORTS = {
+    "GmailConnector": ".core.gmail_connector",
+    "OAuthManager": ".auth.oauth_manager",
+    "EncryptedOAuthManager": ".auth.encrypted_oauth_manager",
+    "MessageReader": ".email.message_reader",
+    "MessageSender": ".email.message_sender",
+    "CredentialManager": ".security.credential_manager",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,23 +4,38 @@ Provides HTTP endpoints for other services to access Gmail operations.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any, List
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-import uvicorn
 
-from ..shared.gmail_factory import get_gmail_connector
+from ..email.message_cache import message_cache
+from ..shared.gmail_factory import get_gmail_connector, start_token_refresh
 from ..shared.decorators import gmail_operation
-from ..shared.utils import validate_max_results, format_email_info, parse_label_list
+from ..shared.logging_config import CorrelationMiddleware
+from ..shared.utils import validate_max_results, format_email_infos, parse_label_list
 
 logger = logging.getLogger(__name__)
 
+# Background OAuth refresher, started with the app
+token_refresher = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start proactive token refresh for the shared Gmail connector."""
+    global token_refresher
+    token_refresher = start_token_refresh()
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Gmail LLM API",
     description="HTTP API for Gmail operations, direct Gmail connector access",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware for cross-origin requests
@@ -32,6 +47,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One correlation ID per request, shared by every log line it produces
+app.add_middleware(CorrelationMiddleware)
+
 # Pydantic models for request/response
 class EmailReadRequest(BaseModel):
     query: str = Field(default="", description="Gmail search query")
@@ -59,6 +77,9 @@ class BulkEmailLabelRequest(BaseModel):
     add_labels: str = Field(default="", description="Comma-separated list of label IDs to add")
     remove_labels: str = Field(default="", description="Comma-separated list of label IDs to remove")
 
+# Routes that call the Gmail connector are plain functions: FastAPI runs them
+# in its threadpool, so a slow Gmail call doesn't block the event loop
+
 # Helper function to get Gmail connector
 def get_connector():
     """Get Gmail connector instance."""
@@ -68,11 +89,16 @@ def get_connector():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "gmail-llm-api"}
+    healthy = token_refresher.healthy if token_refresher else True
+    return {
+        "status": "healthy" if healthy else "unhealthy",
+        "service": "gmail-llm-api",
+        "message_cache": message_cache.stats()
+    }
 
 # Email reading endpoints
 @app.get("/api/emails")
-async def read_emails(
+def read_emails(
     query: str = "",
     max_results: int = 10,
     connector = Depends(get_connector)
@@ -92,7 +118,7 @@ async def read_emails(
         max_results = validate_max_results(max_results)
         
         # Read emails
-        raw_emails = connector.get_messages(query=query, max_results=max_results)
+        raw_emails = connector.get_messages(query=query, max_results=max_results, projection='metadata')
         
         if not raw_emails:
             return {
@@ -103,10 +129,7 @@ async def read_emails(
             }
         
         # Format emails
-        formatted_emails = []
-        for raw_email in raw_emails:
-            formatted_email = format_email_info(raw_email, connector)
-            formatted_emails.append(formatted_email)
+        formatted_emails = format_email_infos(raw_emails, connector)
         
         return {
             "success": True,
@@ -120,7 +143,7 @@ async def read_emails(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/read")
-async def read_emails_post(
+def read_emails_post(
     request: EmailReadRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -130,7 +153,9 @@ async def read_emails_post(
     try:
         # Use the same logic as the GET endpoint
         max_results = validate_max_results(request.max_results)
-        raw_emails = connector.get_messages(query=request.query, max_results=max_results)
+        raw_emails = connector.get_messages(
+            query=request.query, max_results=max_results, projection='metadata'
+        )
         
         if not raw_emails:
             return {
@@ -140,10 +165,7 @@ async def read_emails_post(
                 "count": 0
             }
         
-        formatted_emails = []
-        for raw_email in raw_emails:
-            formatted_email = format_email_info(raw_email, connector)
-            formatted_emails.append(formatted_email)
+        formatted_emails = format_email_infos(raw_emails, connector)
         
         return {
             "success": True,
@@ -157,7 +179,7 @@ async def read_emails_post(
 
 # Email sending endpoint
 @app.post("/api/emails/send")
-async def send_email(
+def send_email(
     request: EmailSendRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -188,7 +210,7 @@ async def send_email(
 
 # Email action endpoints
 @app.post("/api/emails/{message_id}/mark-read")
-async def mark_email_as_read(
+def mark_email_as_read(
     message_id: str,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -203,7 +225,7 @@ async def mark_email_as_read(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/{message_id}/mark-spam")
-async def mark_email_as_spam(
+def mark_email_as_spam(
     message_id: str,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -218,7 +240,7 @@ async def mark_email_as_spam(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/{message_id}/trash")
-async def move_email_to_trash(
+def move_email_to_trash(
     message_id: str,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -233,7 +255,7 @@ async def move_email_to_trash(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/{message_id}/star")
-async def add_star_to_email(
+def add_star_to_email(
     message_id: str,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -248,7 +270,7 @@ async def add_star_to_email(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/{message_id}/labels")
-async def modify_email_labels(
+def modify_email_labels(
     message_id: str,
     request: EmailLabelRequest,
     connector = Depends(get_connector)
@@ -269,7 +291,7 @@ async def modify_email_labels(
 
 # Bulk operation endpoints
 @app.post("/api/emails/bulk/mark-read")
-async def bulk_mark_emails_as_read(
+def bulk_mark_emails_as_read(
     request: BulkEmailActionRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -284,7 +306,7 @@ async def bulk_mark_emails_as_read(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/bulk/mark-spam")
-async def bulk_mark_emails_as_spam(
+def bulk_mark_emails_as_spam(
     request: BulkEmailActionRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -299,7 +321,7 @@ async def bulk_mark_emails_as_spam(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/bulk/trash")
-async def bulk_move_emails_to_trash(
+def bulk_move_emails_to_trash(
     request: BulkEmailActionRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -314,7 +336,7 @@ async def bulk_move_emails_to_trash(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/bulk/star")
-async def bulk_add_stars_to_emails(
+def bulk_add_stars_to_emails(
     request: BulkEmailActionRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -329,7 +351,7 @@ async def bulk_add_stars_to_emails(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/emails/bulk/labels")
-async def bulk_modify_email_labels(
+def bulk_modify_email_labels(
     request: BulkEmailLabelRequest,
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
@@ -349,7 +371,7 @@ async def bulk_modify_email_labels(
 
 # Labels endpoint
 @app.get("/api/labels")
-async def get_available_labels(
+def get_available_labels(
     connector = Depends(get_connector)
 ) -> Dict[str, Any]:
     """Get list of available labels in the Gmail account."""
@@ -364,6 +386,8 @@ async def get_available_labels(
 
 def run_server(host: str = "127.0.0.1", port: int = 8000, log_level: str = "info"):
     """Run the FastAPI server."""
+    import uvicorn
+    
     uvicorn.run(app, host=host, port=port, log_level=log_level)
 
 if __name__ == "__main__":
@@ -83,9 +83,7 @@ class EncryptedOAuthManager(OAuthManager):
                     creds = flow.run_local_server(port=0)
                 
                 # Save encrypted token
-                logger.info("Saving encrypted token")
-                token_data = pickle.dumps(creds)
-                self.credential_manager.encrypt_token(token_data, self.password)
+                self._save_token(creds)
             
             self.credentials = creds
             
@@ -103,4 +101,15 @@ class EncryptedOAuthManager(OAuthManager):
             if self.temp_credentials_file:
                 self.credential_manager.cleanup_temp_file(self.temp_credentials_file)
                 self.temp_credentials_file = None
-            return False
\ No newline at end of file
+            return False
+    
+    def _save_token(self, creds) -> None:
+        """
+        Persist OAuth credentials as an encrypted token.
+        
+        Args:
+            creds: Credentials to save
+        """
+        logger.info("Saving encrypted token")
+        token_data = pickle.dumps(creds)
+        self.credential_manager.encrypt_token(token_data, self.password)
@@ -6,11 +6,16 @@ Handles OAuth 2.0 flow, token storage, and refresh logic.
 import os
 import logging
 import pickle
+import threading
 from typing import Optional
 
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest, build_http
+
+from ..security.credential_manager import atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -71,9 +76,7 @@ class OAuthManager:
                     creds = flow.run_local_server(port=0)
                 
                 # Save credentials for next run
-                logger.info(f"Saving credentials to {self.token_path}")
-                with open(self.token_path, 'wb') as token:
-                    pickle.dump(creds, token)
+                self._save_token(creds)
             
             self.credentials = creds
             logger.info("OAuth authentication successful")
@@ -86,6 +89,39 @@ class OAuthManager:
             logger.error(f"OAuth authentication failed: {type(e).__name__}: {e}")
             return False
     
+    def _save_token(self, creds) -> None:
+        """
+        Persist OAuth credentials for the next run.
+        
+        Args:
+            creds: Credentials to save
+        """
+        logger.info(f"Saving credentials to {self.token_path}")
+        atomic_write_bytes(self.token_path, pickle.dumps(creds))
+    
+    def refresh_credentials(self) -> bool:
+        """
+        Refresh the OAuth access token in place and persist it.
+        
+        Services built from these credentials pick up the new token without
+        being rebuilt, because they hold a reference to the same object.
+        
+        Returns:
+            True if refresh successful, False otherwise
+        """
+        if not self.credentials or not self.credentials.refresh_token:
+            logger.error("No refreshable credentials available")
+            return False
+        
+        try:
+            self.credentials.refresh(Request())
+            self._save_token(self.credentials)
+            logger.info("OAuth credentials refreshed")
+            return True
+        except Exception as e:
+            logger.error(f"OAuth credential refresh failed: {type(e).__name__}: {e}")
+            return False
+    
     def build_service(self, service_name: str = 'gmail', version: str = 'v1'):
         """
         Build Google API service client.
@@ -101,8 +137,21 @@ class OAuthManager:
             logger.error("Not authenticated. Call authenticate() first.")
             return None
         
+        credentials = self.credentials
+        thread_local = threading.local()
+        
+        def build_request(http, *args, **kwargs):
+            # httplib2 is not thread-safe, so each thread gets its own authorized
+            # connection and keeps it alive across requests instead of sharing one.
+            # build_http() keeps the client library's socket timeout and redirect rules.
+            authorized_http = getattr(thread_local, 'http', None)
+            if authorized_http is None:
+                authorized_http = AuthorizedHttp(credentials, http=build_http())
+                thread_local.http = authorized_http
+            return HttpRequest(authorized_http, *args, **kwargs)
+        
         try:
-            service = build(service_name, version, credentials=self.credentials)
+            service = build(service_name, version, credentials=credentials, requestBuilder=build_request)
             logger.info(f"Built {service_name} {version} service successfully")
             return service
         except Exception as e:
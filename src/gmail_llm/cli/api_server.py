@@ -0,0 +1,76 @@
+"""
+HTTP API server entry point (``gmail-api-server``).
+Runs only the FastAPI REST server under uvicorn.
+"""
+
+import os
+import sys
+import argparse
+import importlib.util
+
+from ..config import get_config
+from ..shared.logging_config import build_logging_config, setup_logging, get_logger
+
+def _available(module: str, fallback: str) -> str:
+    """Return module if it is installed, otherwise the fallback implementation."""
+    return module if importlib.util.find_spec(module) is not None else fallback
+
+def main():
+    """Main entry point for HTTP API server."""
+    parser = argparse.ArgumentParser(description="Gmail LLM HTTP API Server")
+    
+    config = get_config()
+    parser.add_argument("--host", default=config.server.api_host, help="API server host")
+    parser.add_argument("--port", type=int, default=config.server.api_port, help="API server port")
+    parser.add_argument("--log-level", default=config.server.log_level, help="Log level")
+    parser.add_argument("--workers", type=int, default=config.server.api_workers,
+                        help="Number of worker processes")
+    
+    args = parser.parse_args()
+    
+    # Setup structured logging
+    setup_logging(
+        log_level=args.log_level,
+        structured=True,
+        correlation_enabled=True
+    )
+    
+    logger = get_logger(__name__)
+    
+    if args.workers > 1 and not os.getenv('GMAIL_MCP_PASSWORD'):
+        # Each worker would prompt for the password on the same terminal
+        logger.warning("GMAIL_MCP_PASSWORD is not set; running a single worker")
+        args.workers = 1
+    
+    try:
+        # Imported after argument parsing so --help and bad arguments return
+        # without loading the FastAPI stack
+        import uvicorn
+        from ..api.rest_server import app
+        
+        logger.info(f"Starting Gmail LLM HTTP API Server on {args.host}:{args.port}")
+        logger.info(f"API Documentation available at: http://{args.host}:{args.port}/docs")
+        
+        # Run the FastAPI server
+        # Worker processes import the app themselves, so uvicorn needs its import string
+        uvicorn.run(
+            "gmail_llm.api.rest_server:app" if args.workers > 1 else app,
+            host=args.host,
+            port=args.port,
+            log_level=args.log_level,
+            access_log=True,
+            workers=args.workers,
+            # Worker processes don't inherit setup_logging(); have uvicorn apply
+            # the same structured, correlation-aware config in each of them
+            log_config=build_logging_config(args.log_level),
+            # C-accelerated event loop and HTTP parser; uvloop is unavailable on Windows
+            loop=_available("uvloop", "asyncio"),
+            http=_available("httptools", "h11")
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to start API server: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
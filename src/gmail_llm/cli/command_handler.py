@@ -63,7 +63,9 @@ class CommandHandler:
         logger.info(f"Handling read command query='{args.query}', max_results={args.max_results}")
         
         # Get messages
-        messages = self.connector.get_messages(query=args.query, max_results=args.max_results)
+        messages = self.connector.get_messages(
+            query=args.query, max_results=args.max_results, projection='metadata'
+        )
         if messages is None:
             print("✗ Failed to retrieve messages")
             logger.error("Read command failed - could not retrieve messages")
@@ -0,0 +1,79 @@
+"""
+Password check entry point (``gmail-verify-password``).
+Checks whether GMAIL_MCP_PASSWORD can decrypt the credentials without
+starting the full service.
+"""
+
+import os
+import sys
+import logging
+import getpass
+
+from ..security.credential_manager import CredentialManager
+
+def verify_password():
+    """Verify if the password can decrypt credentials."""
+    
+    # Set up minimal logging
+    logging.basicConfig(level=logging.WARNING)  # Only show warnings/errors
+    
+    # Get password from environment or prompt user
+    password = os.getenv('GMAIL_MCP_PASSWORD')
+    
+    if not password:
+        try:
+            password = getpass.getpass("Enter password: ")
+        except KeyboardInterrupt:
+            print("\n❌ Cancelled by user")
+            return False
+        
+        if not password:
+            print("❌ No password provided")
+            return False
+    
+    # Initialize credential manager
+    credential_manager = CredentialManager('credentials.encrypted')
+    
+    # Try to decrypt credentials
+    print("🔑 Verifying password...")
+    try:
+        credentials = credential_manager.decrypt_credentials(password)
+        
+        if credentials is not None:
+            print("✅ Password is correct! Credentials decrypted successfully.")
+            
+            # Show some basic info about the credentials (without exposing sensitive data)
+            client_info = credentials.get('installed', {})
+            client_id = client_info.get('client_id')
+            if client_id:
+                # Only show first 20 chars for security
+                suffix = "..." if len(client_id) > 20 else ""
+                print(f"📧 Client ID: {client_id[:20]}{suffix}")
+            
+            return True
+        else:
+            print("❌ Password is incorrect! Could not decrypt credentials.")
+            return False
+            
+    except Exception as e:
+        print(f"❌ Password verification failed: {e}")
+        return False
+
+def main():
+    """Main function."""
+    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
+        print("Usage: gmail-verify-password")
+        print("")
+        print("Verifies if a password can successfully decrypt the encrypted credentials file.")
+        print("")
+        print("The script will:")
+        print("  1. Check for GMAIL_MCP_PASSWORD environment variable")
+        print("  2. If not set, prompt securely for password (hidden input)")
+        print("")
+        print("Usage:")
+        print("  gmail-verify-password  # Will prompt for password")
+        print("  GMAIL_MCP_PASSWORD='...' gmail-verify-password  # Use env var")
+        return
+    
+    success = verify_password()
+    sys.exit(0 if success else 1)
@@ -14,10 +14,13 @@ class GmailConfig:
     credentials_path: str = None
     use_encrypted: bool = True
     max_results_limit: int = 50
+    concurrency: int = None
     
     def __post_init__(self):
         if self.credentials_path is None:
             self.credentials_path = os.getenv('GMAIL_CREDENTIALS_PATH', 'credentials.encrypted')
+        if self.concurrency is None:
+            self.concurrency = int(os.getenv('GMAIL_CONCURRENCY', '4'))
 
 
 @dataclass 
@@ -27,6 +30,7 @@ class ServerConfig:
     mcp_port: int = None
     api_host: str = None
     api_port: int = None
+    api_workers: int = None
     log_level: str = None
     
     def __post_init__(self):
@@ -38,6 +42,8 @@ class ServerConfig:
             self.api_host = os.getenv('GMAIL_API_HOST', '127.0.0.1')
         if self.api_port is None:
             self.api_port = int(os.getenv('GMAIL_API_PORT', '8000'))
+        if self.api_workers is None:
+            self.api_workers = int(os.getenv('GMAIL_API_WORKERS', '1'))
         if self.log_level is None:
             self.log_level = os.getenv('GMAIL_LOG_LEVEL', 'info')
 
@@ -71,4 +77,9 @@ def reload_config() -> AppConfig:
     """Reload configuration from environment variables."""
     global _config
     _config = AppConfig()
+    
+    # Drop values cached from the previous configuration
+    from .shared.utils import _max_results_limit
+    _max_results_limit.cache_clear()
+    
     return _config
\ No newline at end of file
@@ -4,7 +4,7 @@ This is the primary interface for Gmail functionality.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 
 from ..auth.oauth_manager import OAuthManager
 from ..auth.encrypted_oauth_manager import EncryptedOAuthManager
@@ -84,13 +84,16 @@ class GmailConnector:
                 self.message_sender is not None and
                 self.message_labeler is not None)
     
-    def get_messages(self, query: str = '', max_results: int = 10) -> Optional[List[Dict[str, Any]]]:
+    def get_messages(self, query: str = '', max_results: int = 10,
+                     projection: str = 'full') -> Optional[List[Dict[str, Any]]]:
         """
         Retrieve messages from Gmail inbox.
         
         Args:
             query: Gmail search query (e.g., 'is:unread', 'from:example@gmail.com')
             max_results: Maximum number of messages to retrieve
+            projection: 'full' for complete messages, or 'metadata' for headers,
+                snippet and labels only (enough for extract_message_info)
             
         Returns:
             List of message dictionaries or None if error
@@ -99,7 +102,7 @@ class GmailConnector:
             logger.error("Not authenticated. Call authenticate() first.")
             return None
         
-        return self.message_reader.get_messages(query, max_results)
+        return self.message_reader.get_messages(query, max_results, projection)
     
     def extract_message_info(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -136,8 +139,8 @@ class GmailConnector:
         
         return self.message_sender.send_email(to, subject, message_text, html_content)
     
-    def modify_labels(self, message_id: str, add_labels: List[str] = None, 
-                     remove_labels: List[str] = None) -> Dict[str, Any]:
+    def modify_labels(self, message_id: str, add_labels: Sequence[str] = None, 
+                     remove_labels: Sequence[str] = None) -> Dict[str, Any]:
         """
         Modify labels on a Gmail message.
         
@@ -243,8 +246,8 @@ class GmailConnector:
         
         return self.message_labeler.bulk_add_star(message_ids)
     
-    def bulk_modify_labels(self, message_ids: List[str], add_labels: List[str] = None,
-                          remove_labels: List[str] = None) -> Dict[str, Any]:
+    def bulk_modify_labels(self, message_ids: List[str], add_labels: Sequence[str] = None,
+                          remove_labels: Sequence[str] = None) -> Dict[str, Any]:
         """Modify labels on multiple Gmail messages."""
         if not self.is_authenticated():
             logger.error("Not authenticated. Call authenticate() first.")
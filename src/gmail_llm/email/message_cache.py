@@ -0,0 +1,102 @@
+"""
+Process-wide cache of recently fetched Gmail messages.
+Lets repeated reads of the same messages skip the messages.get round trip.
+"""
+
+from threading import Lock
+from typing import Optional, Dict, Any, Iterable
+
+from cachetools import TTLCache
+
+
+class MessageCache:
+    """
+    LRU cache of messages.get responses keyed by (message id, projection).
+
+    Entries expire max_age seconds after they were fetched, so label changes
+    made outside this process (e.g. in the Gmail UI) only stay stale briefly;
+    changes made through MessageLabeler in this process invalidate the entry
+    immediately. Other API worker processes keep their own cache and see the
+    change once their entry expires.
+    """
+
+    PROJECTIONS = ('full', 'metadata')
+
+    def __init__(self, maxsize: int = 2048, max_age: float = 60):
+        """
+        Initialize message cache.
+
+        Args:
+            maxsize: Maximum number of cached messages
+            max_age: Seconds a cached message is served before refetching
+        """
+        self.max_age = max_age
+        # Expired entries are purged on every insert, before LRU eviction
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=max_age)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        # Bumped by invalidate(); fetches that straddle an invalidation
+        # aren't cached since they may carry the old labels
+        self.version = 0
+
+    def get(self, message_id: str, projection: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached message.
+
+        Args:
+            message_id: Gmail message ID
+            projection: Projection the message was fetched with
+
+        Returns:
+            Cached message dictionary or None on a miss
+        """
+        with self._lock:
+            message = self._cache.get((message_id, projection))
+            if message is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return message
+
+    def put(self, message_id: str, projection: str, message: Dict[str, Any],
+            version: Optional[int] = None) -> None:
+        """
+        Cache a message fetched with the given projection.
+
+        Args:
+            message_id: Gmail message ID
+            projection: Projection the message was fetched with
+            message: Message dictionary returned by messages.get
+            version: Cache version read before the fetch started; the message
+                is skipped if an invalidation happened since
+        """
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._cache[(message_id, projection)] = message
+
+    def invalidate(self, message_ids: Iterable[str]) -> None:
+        """Drop every cached projection of the given messages."""
+        with self._lock:
+            self.version += 1
+            for message_id in message_ids:
+                for projection in self.PROJECTIONS:
+                    self._cache.pop((message_id, projection), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit ratio, for health reporting."""
+        with self._lock:
+            self._cache.expire()
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+
+# Shared by every connector in the process; message IDs are per-account and
+# each process serves a single Gmail account.
+message_cache = MessageCache()
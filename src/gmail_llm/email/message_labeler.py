@@ -4,10 +4,12 @@ Handles adding/removing labels from Gmail messages.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 
 from googleapiclient.errors import HttpError
 
+from .message_cache import message_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,8 +26,8 @@ class MessageLabeler:
         self.service = gmail_service
         logger.info("Initializing MessageLabeler")
     
-    def modify_labels(self, message_id: str, add_labels: List[str] = None, 
-                     remove_labels: List[str] = None) -> Dict[str, Any]:
+    def modify_labels(self, message_id: str, add_labels: Sequence[str] = None, 
+                     remove_labels: Sequence[str] = None) -> Dict[str, Any]:
         """
         Modify labels on a Gmail message.
         
@@ -55,11 +57,17 @@ class MessageLabeler:
             logger.info(f"Modifying labels for message {message_id}: add={add_labels}, remove={remove_labels}")
             
             # Execute the modify request
-            result = self.service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body=body
-            ).execute()
+            try:
+                result = self.service.users().messages().modify(
+                    userId='me',
+                    id=message_id,
+                    body=body
+                ).execute()
+            finally:
+                # Cached copies carry the old labels. Dropping them after the modify
+                # also bumps the cache version, so a read already in flight can't
+                # re-cache the old state
+                message_cache.invalidate([message_id])
             
             logger.info(f"Successfully modified labels for message {message_id}")
             return {
@@ -194,8 +202,8 @@ class MessageLabeler:
             logger.error(error_msg)
             return {"success": False, "message": error_msg, "labels": []}
     
-    def bulk_modify_labels(self, message_ids: List[str], add_labels: List[str] = None,
-                          remove_labels: List[str] = None) -> Dict[str, Any]:
+    def bulk_modify_labels(self, message_ids: List[str], add_labels: Sequence[str] = None,
+                          remove_labels: Sequence[str] = None) -> Dict[str, Any]:
         """
         Modify labels on multiple Gmail messages in bulk.
         
@@ -232,11 +240,15 @@ class MessageLabeler:
                     body['removeLabelIds'] = remove_labels
                 
                 # Execute the modify request
-                result = self.service.users().messages().modify(
-                    userId='me',
-                    id=message_id,
-                    body=body
-                ).execute()
+                try:
+                    result = self.service.users().messages().modify(
+                        userId='me',
+                        id=message_id,
+                        body=body
+                    ).execute()
+                finally:
+                    # Drop cached copies once the new labels are in place
+                    message_cache.invalidate([message_id])
                 
                 results.append({
                     "message_id": message_id,
@@ -4,12 +4,31 @@ Handles retrieving and parsing Gmail messages.
 """
 
 import logging
+from threading import Lock
 from typing import Optional, List, Dict, Any
 
+from cachetools import LRUCache
 from googleapiclient.errors import HttpError
 
+from .message_cache import message_cache
+
 logger = logging.getLogger(__name__)
 
+# Parsed message info keyed by (message id, historyId). Gmail bumps historyId on
+# every change to a message, so a matching key means the parsed fields still hold.
+_MESSAGE_INFO_CACHE_SIZE = 4096
+_message_info_cache: LRUCache = LRUCache(maxsize=_MESSAGE_INFO_CACHE_SIZE)
+_message_info_lock = Lock()
+
+# Request parameters for the 'metadata' projection: only the headers and fields
+# that extract_message_info reads, with no body parts to download or decode.
+METADATA_HEADERS = ['From', 'To', 'Subject', 'Date']
+METADATA_FIELDS = 'id,threadId,historyId,snippet,labelIds,payload/headers'
+
+# Sub-requests per batch HTTP call. The API accepts 100, but Gmail recommends
+# staying at or below 50 to avoid per-user rate limiting.
+BATCH_SIZE = 50
+
 
 class MessageReader:
     """Handles reading Gmail messages."""
@@ -24,13 +43,16 @@ class MessageReader:
         self.service = gmail_service
         logger.info("Initializing MessageReader")
     
-    def get_messages(self, query: str = '', max_results: int = 10) -> Optional[List[Dict[str, Any]]]:
+    def get_messages(self, query: str = '', max_results: int = 10,
+                     projection: str = 'full') -> Optional[List[Dict[str, Any]]]:
         """
         Retrieve messages from Gmail inbox.
         
         Args:
             query: Gmail search query (e.g., 'is:unread', 'from:example@gmail.com')
             max_results: Maximum number of messages to retrieve
+            projection: 'full' for complete messages, or 'metadata' for just the
+                headers and fields used by extract_message_info
             
         Returns:
             List of message dictionaries or None if error
@@ -46,7 +68,8 @@ class MessageReader:
             result = self.service.users().messages().list(
                 userId='me',
                 q=query,
-                maxResults=max_results
+                maxResults=max_results,
+                fields='messages/id'
             ).execute()
             
             messages = result.get('messages', [])
@@ -56,19 +79,51 @@ class MessageReader:
                 logger.info("No messages found")
                 return []
             
-            # Get full message details
-            detailed_messages = []
-            for message in messages:
-                try:
-                    msg = self.service.users().messages().get(
-                        userId='me',
-                        id=message['id']
-                    ).execute()
-                    detailed_messages.append(msg)
-                    logger.debug(f"Retrieved message id={message['id']}")
-                except HttpError as e:
-                    logger.error(f"Failed to retrieve message {message['id']}: {e}")
-                    continue
+            if projection == 'metadata':
+                get_params = {
+                    'format': 'metadata',
+                    'metadataHeaders': METADATA_HEADERS,
+                    'fields': METADATA_FIELDS
+                }
+            else:
+                get_params = {}
+            
+            # Serve recently fetched messages from cache, fetch the rest
+            message_ids = [message['id'] for message in messages]
+            fetched = {}
+            missing_ids = []
+            cache_version = message_cache.version
+            for message_id in message_ids:
+                cached = message_cache.get(message_id, projection)
+                if cached is not None:
+                    fetched[message_id] = cached
+                else:
+                    missing_ids.append(message_id)
+            
+            def collect(request_id, response, exception):
+                if exception is not None:
+                    logger.error(f"Failed to retrieve message {request_id}: {exception}")
+                    return
+                fetched[request_id] = response
+                message_cache.put(request_id, projection, response, cache_version)
+                logger.debug(f"Retrieved message id={request_id}")
+            
+            # Get message details, many per HTTP round trip
+            for start in range(0, len(missing_ids), BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=collect)
+                for message_id in missing_ids[start:start + BATCH_SIZE]:
+                    batch.add(
+                        self.service.users().messages().get(
+                            userId='me',
+                            id=message_id,
+                            **get_params
+                        ),
+                        request_id=message_id
+                    )
+                batch.execute()
+            
+            # Preserve the order returned by messages.list
+            detailed_messages = [fetched[message_id] for message_id in message_ids if message_id in fetched]
             
             logger.info(f"Successfully retrieved {len(detailed_messages)} detailed messages")
             return detailed_messages
@@ -90,6 +145,15 @@ class MessageReader:
         Returns:
             Dictionary with extracted message information
         """
+        cache_key = None
+        history_id = message.get('historyId')
+        if history_id is not None and 'id' in message:
+            cache_key = (message['id'], history_id)
+            with _message_info_lock:
+                info = _message_info_cache.get(cache_key)
+            if info is not None:
+                return info
+        
         try:
             headers = message['payload'].get('headers', [])
             header_dict = {h['name']: h['value'] for h in headers}
@@ -106,6 +170,9 @@ class MessageReader:
             }
             
             logger.debug(f"Extracted info for message {info['id']}: subject='{info['subject']}'")
+            if cache_key is not None:
+                with _message_info_lock:
+                    _message_info_cache[cache_key] = info
             return info
             
         except KeyError as e:
@@ -3,8 +3,15 @@ MCP (Model Context Protocol) server module for Gmail operations.
 Provides FastAPI-based MCP server for LLM integration.
 """
 
-from .server import app
 from .tools import GmailMCPTools
-from .schemas import MCP_TOOLS, MCP_SERVER_INFO
+from .schemas import MCP_TOOLS, MCP_TOOLS_BY_NAME, MCP_SERVER_INFO
 
-__all__ = ["app", "GmailMCPTools", "MCP_TOOLS", "MCP_SERVER_INFO"]
\ No newline at end of file
+__all__ = ["app", "GmailMCPTools", "MCP_TOOLS", "MCP_TOOLS_BY_NAME", "MCP_SERVER_INFO"]
+
+
+def __getattr__(name):
+    # The FastAPI app is only built when something actually serves it
+    if name == "app":
+        from .server import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,29 +5,36 @@ Refactored to eliminate code duplication and use shared components.
 """
 
 import logging
-from typing import Dict, Any, List
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING, Dict, Any, List
 
-from ..shared.decorators import gmail_operation, retry_on_auth_failure, validate_message_ids
+from ..shared.decorators import gmail_operation, run_in_thread, validate_message_ids
+from ..shared.gmail_factory import start_token_refresh
 from ..shared.utils import (
-    validate_max_results, format_email_info, parse_label_list, 
-    create_success_response, create_error_response, create_bulk_operation_result,
-    validate_email_address, sanitize_email_content
+    validate_max_results, format_email_infos, parse_label_list, 
+    create_success_response, create_error_response,
+    validate_email_address
 )
 
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
 
-def create_gmail_mcp_server() -> FastMCP:
+def create_gmail_mcp_server() -> "FastMCP":
     """Create and configure a FastMCP server for Gmail operations."""
+    from fastmcp import FastMCP
     
     # Initialize FastMCP server without authentication for now
     # We'll add OAuth support once we verify the basic connection works
     mcp = FastMCP("Gmail LLM Connector")
+    
+    # Keep the shared connector's token fresh instead of retrying on auth failures
+    start_token_refresh()
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("read_emails")
-    @retry_on_auth_failure()
     def read_emails(connector, query: str = "", max_results: int = 10) -> Dict[str, Any]:
         """
         Read emails from Gmail inbox with optional search query and result limit.
@@ -46,7 +53,7 @@ def create_gmail_mcp_server() -> FastMCP:
             return create_error_response(str(e), "read_emails", "ValidationError")
         
         # Read emails
-        raw_emails = connector.get_messages(query=query, max_results=max_results)
+        raw_emails = connector.get_messages(query=query, max_results=max_results, projection='metadata')
         
         if not raw_emails:
             return create_success_response(
@@ -56,10 +63,7 @@ def create_gmail_mcp_server() -> FastMCP:
             )
         
         # Extract and format email information
-        formatted_emails = []
-        for raw_email in raw_emails:
-            formatted_email = format_email_info(raw_email, connector)
-            formatted_emails.append(formatted_email)
+        formatted_emails = format_email_infos(raw_emails, connector)
         
         return create_success_response(
             f"Retrieved {len(formatted_emails)} emails",
@@ -68,8 +72,8 @@ def create_gmail_mcp_server() -> FastMCP:
         )
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("send_email")
-    @retry_on_auth_failure()
     def send_email(connector, to: str, subject: str, message: str, html_content: str = None) -> Dict[str, Any]:
         """
         Send an email via Gmail.
@@ -111,8 +115,8 @@ def create_gmail_mcp_server() -> FastMCP:
             return create_error_response("Failed to send email", "send_email")
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("mark_as_read")
-    @retry_on_auth_failure()
     def mark_as_read(connector, message_id: str) -> Dict[str, Any]:
         """
         Mark an email as read by removing the UNREAD label.
@@ -130,8 +134,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result  # GmailConnector already returns standardized format
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("mark_as_spam")
-    @retry_on_auth_failure()
     def mark_as_spam(connector, message_id: str) -> Dict[str, Any]:
         """
         Mark an email as spam by moving it to the spam folder.
@@ -149,8 +153,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("move_to_trash")
-    @retry_on_auth_failure()
     def move_to_trash(connector, message_id: str) -> Dict[str, Any]:
         """
         Move an email to trash.
@@ -168,8 +172,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("add_star")
-    @retry_on_auth_failure()
     def add_star(connector, message_id: str) -> Dict[str, Any]:
         """
         Add a star to an email.
@@ -187,8 +191,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("get_available_labels")
-    @retry_on_auth_failure()
     def get_available_labels(connector) -> Dict[str, Any]:
         """
         Get list of available labels in the Gmail account.
@@ -200,8 +204,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("modify_labels")
-    @retry_on_auth_failure()
     def modify_labels(connector, message_id: str, add_labels: str = "", remove_labels: str = "") -> Dict[str, Any]:
         """
         Modify labels on an email by adding or removing specific labels.
@@ -228,8 +232,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("bulk_mark_as_read")
-    @retry_on_auth_failure()
     @validate_message_ids
     def bulk_mark_as_read(connector, message_ids: List[str]) -> Dict[str, Any]:
         """
@@ -245,8 +249,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("bulk_mark_as_spam")
-    @retry_on_auth_failure()
     @validate_message_ids
     def bulk_mark_as_spam(connector, message_ids: List[str]) -> Dict[str, Any]:
         """
@@ -262,8 +266,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("bulk_move_to_trash")
-    @retry_on_auth_failure()
     @validate_message_ids
     def bulk_move_to_trash(connector, message_ids: List[str]) -> Dict[str, Any]:
         """
@@ -279,8 +283,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("bulk_add_star")
-    @retry_on_auth_failure()
     @validate_message_ids
     def bulk_add_star(connector, message_ids: List[str]) -> Dict[str, Any]:
         """
@@ -296,8 +300,8 @@ def create_gmail_mcp_server() -> FastMCP:
         return result
 
     @mcp.tool
+    @run_in_thread
     @gmail_operation("bulk_modify_labels")
-    @retry_on_auth_failure()
     @validate_message_ids
     def bulk_modify_labels(connector, message_ids: List[str], add_labels: str = "", remove_labels: str = "") -> Dict[str, Any]:
         """
@@ -3,7 +3,10 @@ MCP server schema definitions for Gmail operations.
 Defines the data models and tool schemas for the MCP server.
 """
 
-from typing import Optional, List, Dict, Any
+import types
+from typing import Optional, List, Dict, Any, Mapping
+
+import orjson
 from pydantic import BaseModel, Field
 
 
@@ -101,6 +104,13 @@ MCP_TOOLS = [
 ]
 
 
+# Tool definitions keyed by name, and the tools/list response body serialized once at import
+MCP_TOOLS_BY_NAME: Mapping[str, Dict[str, Any]] = types.MappingProxyType(
+    {tool["name"]: tool for tool in MCP_TOOLS}
+)
+MCP_TOOLS_JSON: bytes = orjson.dumps({"tools": MCP_TOOLS})
+
+
 # MCP Server Info
 MCP_SERVER_INFO = {
     "name": "gmail-llm-connector",
@@ -108,4 +118,5 @@ MCP_SERVER_INFO = {
     "description": "MCP server for Gmail operations - read and send emails through Gmail API",
     "author": "Gmail LLM Connector",
     "homepage": "https://github.com/yourusername/gmail-llm-connector"
-}
\ No newline at end of file
+}
+MCP_SERVER_INFO_JSON: bytes = orjson.dumps(MCP_SERVER_INFO)
@@ -5,22 +5,40 @@ Provides MCP-compliant endpoints for LLMs to interact with Gmail.
 
 import logging
 import asyncio
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from ..core.gmail_connector import GmailConnector
+from ..config import get_config
+from ..email.message_cache import message_cache
+from ..shared.token_refresher import TokenRefresher
 from .tools import GmailMCPTools
-from .schemas import MCP_TOOLS, MCP_SERVER_INFO
+from .schemas import MCP_TOOLS, MCP_TOOLS_JSON, MCP_SERVER_INFO_JSON
+
+if TYPE_CHECKING:
+    from ..core.gmail_connector import GmailConnector
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent tool calls regardless of GMAIL_CONCURRENCY
+MAX_CONCURRENCY = 10
+
 # Global variables for Gmail connector and tools
-gmail_connector: GmailConnector = None
+gmail_connector: "GmailConnector" = None
 gmail_tools: GmailMCPTools = None
+tool_slots: asyncio.Semaphore = None
+token_refresher: TokenRefresher = None
+
+
+async def _run_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a tool on a worker thread while holding one of the concurrency slots."""
+    async with tool_slots:
+        return await run_in_threadpool(gmail_tools.call_tool, tool_name, arguments)
 
 
 # MCP Protocol Models
@@ -29,11 +47,6 @@ class MCPListToolsRequest(BaseModel):
     method: str = "tools/list"
 
 
-class MCPListToolsResponse(BaseModel):
-    """MCP list tools response."""
-    tools: List[Dict[str, Any]]
-
-
 class MCPCallToolRequest(BaseModel):
     """MCP call tool request."""
     method: str = "tools/call"
@@ -46,22 +59,15 @@ class MCPCallToolResponse(BaseModel):
     isError: bool = False
 
 
-class MCPServerInfoResponse(BaseModel):
-    """MCP server info response."""
-    name: str
-    version: str
-    description: str
-    author: str
-    homepage: str
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown tasks."""
     # Startup
     logger.info("Starting Gmail MCP server...")
     
-    global gmail_connector, gmail_tools
+    global gmail_connector, gmail_tools, tool_slots, token_refresher
+    
+    from ..core.gmail_connector import GmailConnector
     
     try:
         # Initialize Gmail connector with encrypted credentials
@@ -75,19 +81,27 @@ async def lifespan(app: FastAPI):
             logger.error("Failed to authenticate Gmail connector")
             raise RuntimeError("Gmail authentication failed")
         
-        # Initialize MCP tools
+        # Initialize MCP tools; the connector keeps one HTTP connection per
+        # worker thread, so the semaphore is what bounds concurrent Gmail calls
         gmail_tools = GmailMCPTools(gmail_connector)
+        concurrency = max(1, min(MAX_CONCURRENCY, get_config().gmail.concurrency))
+        tool_slots = asyncio.Semaphore(concurrency)
         
-        logger.info("Gmail MCP server started successfully")
+        token_refresher = TokenRefresher(lambda: gmail_connector.auth_manager)
+        token_refresher.start()
+        
+        logger.info("Gmail MCP server started successfully with concurrency %d", concurrency)
         
     except Exception as e:
-        logger.error(f"Failed to start Gmail MCP server: {e}")
+        logger.error("Failed to start Gmail MCP server: %s", e)
         raise
     
     yield
     
     # Shutdown
     logger.info("Shutting down Gmail MCP server...")
+    if token_refresher:
+        token_refresher.stop()
 
 
 # Create FastAPI app
@@ -95,7 +109,8 @@ app = FastAPI(
     title="Gmail LLM Connector MCP Server",
     description="MCP server for Gmail operations - read and send emails through Gmail API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -118,13 +133,13 @@ async def root():
     }
 
 
-@app.get("/info", response_model=MCPServerInfoResponse)
+@app.get("/info")
 async def get_server_info():
     """Get MCP server information."""
-    return MCPServerInfoResponse(**MCP_SERVER_INFO)
+    return Response(content=MCP_SERVER_INFO_JSON, media_type="application/json")
 
 
-@app.post("/mcp/tools/list", response_model=MCPListToolsResponse)
+@app.post("/mcp/tools/list")
 async def list_tools(request: MCPListToolsRequest):
     """List available MCP tools."""
     logger.info("Received tools/list request")
@@ -132,13 +147,13 @@ async def list_tools(request: MCPListToolsRequest):
     if not gmail_connector or not gmail_connector.is_authenticated():
         raise HTTPException(status_code=500, detail="Gmail connector not authenticated")
     
-    return MCPListToolsResponse(tools=MCP_TOOLS)
+    return Response(content=MCP_TOOLS_JSON, media_type="application/json")
 
 
 @app.post("/mcp/tools/call", response_model=MCPCallToolResponse)
 async def call_tool(request: MCPCallToolRequest):
     """Call an MCP tool."""
-    logger.info(f"Received tools/call request for tool: {request.params.get('name')}")
+    logger.info("Received tools/call request for tool: %s", request.params.get("name"))
     
     if not gmail_connector or not gmail_connector.is_authenticated():
         raise HTTPException(status_code=500, detail="Gmail connector not authenticated")
@@ -153,47 +168,51 @@ async def call_tool(request: MCPCallToolRequest):
         if not tool_name:
             raise ValueError("Tool name is required")
         
-        # Call the tool
-        result = await gmail_tools.call_tool(tool_name, tool_arguments)
+        # Call the tool; shielded so a cancelled request keeps its concurrency
+        # slot until the worker thread has actually finished
+        result = await asyncio.shield(_run_tool(tool_name, tool_arguments))
         
-        # Format response according to MCP protocol
-        return MCPCallToolResponse(
-            content=[
+        # Format response according to MCP protocol; the shape is fixed, so
+        # skip response-model validation and serialize the dict directly
+        return ORJSONResponse(content={
+            "content": [
                 {
                     "type": "text",
                     "text": str(result)
                 }
             ],
-            isError=not result.get("success", False)
-        )
+            "isError": not result.get("success", False)
+        })
         
     except Exception as e:
-        logger.error(f"Error calling tool: {e}")
-        return MCPCallToolResponse(
-            content=[
+        logger.error("Error calling tool: %s", e)
+        return ORJSONResponse(content={
+            "content": [
                 {
                     "type": "text", 
                     "text": f"Error: {str(e)}"
                 }
             ],
-            isError=True
-        )
+            "isError": True
+        })
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    healthy = token_refresher.healthy if token_refresher else True
     return {
-        "status": "healthy",
+        "status": "healthy" if healthy else "unhealthy",
         "gmail_authenticated": gmail_connector.is_authenticated() if gmail_connector else False,
-        "tools_available": len(gmail_tools.get_available_tools()) if gmail_tools else 0
+        "tools_available": len(MCP_TOOLS) if gmail_tools else 0,
+        "message_cache": message_cache.stats()
     }
 
 
 @app.post("/tools/{tool_name}")
 async def call_tool_direct(tool_name: str, arguments: Dict[str, Any]):
     """Direct tool calling endpoint (non-MCP)."""
-    logger.info(f"Direct tool call: {tool_name}")
+    logger.info("Direct tool call: %s", tool_name)
     
     if not gmail_connector or not gmail_connector.is_authenticated():
         raise HTTPException(status_code=500, detail="Gmail connector not authenticated")
@@ -202,10 +221,10 @@ async def call_tool_direct(tool_name: str, arguments: Dict[str, Any]):
         raise HTTPException(status_code=500, detail="Gmail tools not initialized")
     
     try:
-        result = await gmail_tools.call_tool(tool_name, arguments)
+        result = await asyncio.shield(_run_tool(tool_name, arguments))
         return result
     except Exception as e:
-        logger.error(f"Error in direct tool call: {e}")
+        logger.error("Error in direct tool call: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
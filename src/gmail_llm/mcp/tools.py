@@ -4,24 +4,24 @@ Implements the actual tool functions that handle email reading and sending.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 
-from ..core.gmail_connector import GmailConnector
 from .schemas import (
+    MCP_TOOLS_BY_NAME,
     ReadEmailsRequest, 
-    SendEmailRequest, 
-    ReadEmailsResponse, 
-    SendEmailResponse,
-    EmailInfo
+    SendEmailRequest
 )
 
+if TYPE_CHECKING:
+    from ..core.gmail_connector import GmailConnector
+
 logger = logging.getLogger(__name__)
 
 
 class GmailMCPTools:
     """MCP tools implementation for Gmail operations."""
     
-    def __init__(self, gmail_connector: GmailConnector):
+    def __init__(self, gmail_connector: "GmailConnector"):
         """
         Initialize Gmail MCP tools.
         
@@ -29,9 +29,10 @@ class GmailMCPTools:
             gmail_connector: Authenticated GmailConnector instance
         """
         self.gmail = gmail_connector
+        self._dispatch = {name: getattr(self, name) for name in MCP_TOOLS_BY_NAME}
         logger.info("Initialized GmailMCPTools")
     
-    async def read_emails(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def read_emails(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Read emails from Gmail inbox.
         
@@ -42,73 +43,78 @@ class GmailMCPTools:
             Dictionary with operation result and email data
         """
         try:
-            # Parse and validate request
-            request = ReadEmailsRequest(**arguments)
-            logger.info(f"Reading emails with query='{request.query}', max_results={request.max_results}")
+            # Validate arguments once; responses are built as plain dicts
+            request = ReadEmailsRequest.model_validate(arguments)
+            logger.info("Reading emails with query='%s', max_results=%d", request.query, request.max_results)
             
             # Check authentication
             if not self.gmail.is_authenticated():
                 logger.error("Gmail connector not authenticated")
-                return ReadEmailsResponse(
-                    success=False,
-                    message="Gmail connector not authenticated",
-                    emails=[],
-                    count=0
-                ).dict()
+                return {
+                    "success": False,
+                    "message": "Gmail connector not authenticated",
+                    "emails": [],
+                    "count": 0
+                }
             
             # Get messages from Gmail
-            messages = self.gmail.get_messages(query=request.query, max_results=request.max_results)
+            messages = self.gmail.get_messages(
+                query=request.query,
+                max_results=request.max_results,
+                projection='metadata'
+            )
             
             if messages is None:
                 logger.error("Failed to retrieve messages from Gmail")
-                return ReadEmailsResponse(
-                    success=False,
-                    message="Failed to retrieve messages from Gmail API",
-                    emails=[],
-                    count=0
-                ).dict()
+                return {
+                    "success": False,
+                    "message": "Failed to retrieve messages from Gmail API",
+                    "emails": [],
+                    "count": 0
+                }
             
-            # Process messages into EmailInfo objects
+            # Build EmailInfo-shaped dicts in one pass, without model round trips
             email_list = []
+            append = email_list.append
+            extract = self.gmail.extract_message_info
             for message in messages:
                 try:
-                    info = self.gmail.extract_message_info(message)
+                    info = extract(message)
                     if 'error' not in info:
-                        email_info = EmailInfo(
-                            id=info['id'],
-                            thread_id=info['thread_id'],
-                            from_address=info['from'],
-                            to_address=info['to'],
-                            subject=info['subject'],
-                            date=info['date'],
-                            snippet=info['snippet'],
-                            label_ids=info['label_ids']
-                        )
-                        email_list.append(email_info)
+                        append({
+                            "id": info['id'],
+                            "thread_id": info['thread_id'],
+                            "from_address": info['from'],
+                            "to_address": info['to'],
+                            "subject": info['subject'],
+                            "date": info['date'],
+                            "snippet": info['snippet'],
+                            "label_ids": info['label_ids']
+                        })
                     else:
-                        logger.warning(f"Error processing message: {info['error']}")
+                        logger.warning("Error processing message: %s", info['error'])
                 except Exception as e:
-                    logger.error(f"Error processing message: {e}")
+                    logger.error("Error processing message: %s", e)
                     continue
             
-            logger.info(f"Successfully processed {len(email_list)} emails")
-            return ReadEmailsResponse(
-                success=True,
-                message=f"Retrieved {len(email_list)} emails",
-                emails=email_list,
-                count=len(email_list)
-            ).dict()
+            logger.info("Successfully processed %d emails", len(email_list))
+            return {
+                "success": True,
+                "message": f"Retrieved {len(email_list)} emails",
+                "emails": email_list,
+                "count": len(email_list)
+            }
             
         except Exception as e:
-            logger.error(f"Error in read_emails tool: {type(e).__name__}: {e}")
-            return ReadEmailsResponse(
-                success=False,
-                message=f"Error reading emails: {str(e)}",
-                emails=[],
-                count=0
-            ).dict()
+            logger.error("Error in read_emails tool: %s: %s", type(e).__name__, e)
+            return {
+                "success": False,
+                "message": f"Error reading emails: {str(e)}",
+                "emails": [],
+                "count": 0
+            }
     
-    async def send_email(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def send_email(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send an email via Gmail.
         
@@ -119,17 +125,18 @@ class GmailMCPTools:
             Dictionary with operation result
         """
         try:
-            # Parse and validate request
-            request = SendEmailRequest(**arguments)
-            logger.info(f"Sending email to={request.to}, subject='{request.subject}'")
+            # Validate arguments once; responses are built as plain dicts
+            request = SendEmailRequest.model_validate(arguments)
+            logger.info("Sending email to=%s, subject='%s'", request.to, request.subject)
             
             # Check authentication
             if not self.gmail.is_authenticated():
                 logger.error("Gmail connector not authenticated")
-                return SendEmailResponse(
-                    success=False,
-                    message="Gmail connector not authenticated"
-                ).dict()
+                return {
+                    "success": False,
+                    "message": "Gmail connector not authenticated",
+                    "message_id": None
+                }
             
             # Send email
             success = self.gmail.send_email(
@@ -140,25 +147,27 @@ class GmailMCPTools:
             )
             
             if success:
-                logger.info(f"Email sent successfully to {request.to}")
-                return SendEmailResponse(
-                    success=True,
-                    message=f"Email sent successfully to {request.to}",
-                    message_id="unknown"  # Gmail API doesn't return message ID in our current implementation
-                ).dict()
+                logger.info("Email sent successfully to %s", request.to)
+                return {
+                    "success": True,
+                    "message": f"Email sent successfully to {request.to}",
+                    "message_id": "unknown"  # Gmail API doesn't return message ID in our current implementation
+                }
             else:
-                logger.error(f"Failed to send email to {request.to}")
-                return SendEmailResponse(
-                    success=False,
-                    message=f"Failed to send email to {request.to}"
-                ).dict()
+                logger.error("Failed to send email to %s", request.to)
+                return {
+                    "success": False,
+                    "message": f"Failed to send email to {request.to}",
+                    "message_id": None
+                }
                 
         except Exception as e:
-            logger.error(f"Error in send_email tool: {type(e).__name__}: {e}")
-            return SendEmailResponse(
-                success=False,
-                message=f"Error sending email: {str(e)}"
-            ).dict()
+            logger.error("Error in send_email tool: %s: %s", type(e).__name__, e)
+            return {
+                "success": False,
+                "message": f"Error sending email: {str(e)}",
+                "message_id": None
+            }
     
     def get_available_tools(self) -> List[str]:
         """
@@ -167,12 +176,15 @@ class GmailMCPTools:
         Returns:
             List of tool names
         """
-        return ["read_emails", "send_email"]
+        return list(self._dispatch)
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call a tool by name with given arguments.
         
+        Tool handlers are synchronous because the Gmail client blocks; async
+        callers should run this in a worker thread.
+        
         Args:
             name: Tool name
             arguments: Tool arguments
@@ -180,14 +192,14 @@ class GmailMCPTools:
         Returns:
             Tool execution result
         """
-        logger.info(f"Calling tool: {name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Calling tool: %s", name)
         
-        if name == "read_emails":
-            return await self.read_emails(arguments)
-        elif name == "send_email":
-            return await self.send_email(arguments)
+        handler = self._dispatch.get(name)
+        if handler is not None:
+            return handler(arguments)
         else:
-            logger.error(f"Unknown tool: {name}")
+            logger.error("Unknown tool: %s", name)
             return {
                 "success": False,
                 "message": f"Unknown tool: {name}",
@@ -6,9 +6,12 @@ Uses Fernet encryption with password-based key derivation.
 
 import os
 import json
+import hmac
+import hashlib
 import logging
 import getpass
-from typing import Optional, Dict, Any
+import tempfile
+from typing import Optional, Dict, Any, Tuple
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -18,6 +21,30 @@ import base64
 logger = logging.getLogger(__name__)
 
 
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Replace a file's contents atomically.
+    
+    Writes to a temporary file in the same directory and renames it over the
+    target, so a process reading the file concurrently (e.g. another server
+    loading the token after a refresh) sees either the old or the new
+    contents, never a truncated file.
+    
+    Args:
+        path: File to write
+        data: Bytes to write
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
 class CredentialManager:
     """Manages encrypted storage and retrieval of Google API credentials."""
     
@@ -30,12 +57,17 @@ class CredentialManager:
         """
         self.encrypted_file = encrypted_file
         self.salt_file = encrypted_file + '.salt'
+        # (sha256(salt + password), derived key) for the last password used
+        self._key_cache: Optional[Tuple[bytes, bytes]] = None
         logger.info(f"Initializing CredentialManager with encrypted_file={encrypted_file}")
     
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         """
         Derive encryption key from password using PBKDF2.
         
+        The most recent key is kept so repeated calls with the same password
+        and salt skip the derivation.
+        
         Args:
             password: User password
             salt: Salt bytes for key derivation
@@ -43,6 +75,13 @@ class CredentialManager:
         Returns:
             Derived encryption key
         """
+        # The credentials and token files share one password and salt, so
+        # reuse the key instead of paying for PBKDF2 on every decrypt
+        fingerprint = hashlib.sha256(salt + password.encode()).digest()
+        cached = self._key_cache
+        if cached is not None and hmac.compare_digest(cached[0], fingerprint):
+            return cached[1]
+        
         logger.debug("Deriving encryption key from password")
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
@@ -51,6 +90,7 @@ class CredentialManager:
             iterations=100000,
         )
         key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        self._key_cache = (fingerprint, key)
         return key
     
     def _get_salt(self) -> bytes:
@@ -243,8 +283,7 @@ class CredentialManager:
             # Save encrypted token
             encrypted_token_path = self.encrypted_file.replace('.encrypted', '_token.encrypted')
             logger.info(f"Saving encrypted token to {encrypted_token_path}")
-            with open(encrypted_token_path, 'wb') as f:
-                f.write(encrypted_data)
+            atomic_write_bytes(encrypted_token_path, encrypted_data)
             
             logger.info("Token encrypted successfully")
             return True
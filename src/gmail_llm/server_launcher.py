@@ -5,21 +5,46 @@ Refactored to use shared configuration and proper logging.
 """
 
 import asyncio
-import logging
+import contextlib
+import os
 import signal
 import sys
-from typing import Optional
-import uvicorn
-from concurrent.futures import ThreadPoolExecutor
-import threading
+from typing import TYPE_CHECKING, Optional
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the stdlib loop
+    uvloop = None
 
-from .mcp.fastmcp_server import create_gmail_mcp_server
-from .api.rest_server import app as fastapi_app
 from .config import get_config
 from .shared.logging_config import setup_logging, get_logger
 
+if TYPE_CHECKING:
+    import uvicorn
+
 logger = get_logger(__name__)
 
+
+def _create_uvicorn_server(config) -> "uvicorn.Server":
+    """
+    Create a uvicorn server that leaves signal handling to the launcher.
+
+    Both servers share one event loop, so signals are handled once by
+    DualServerLauncher instead of each server installing its own handlers.
+    """
+    import uvicorn
+
+    class _LauncherServer(uvicorn.Server):
+        @contextlib.contextmanager
+        def capture_signals(self):
+            yield
+
+        def install_signal_handlers(self) -> None:
+            pass
+
+    return _LauncherServer(config)
+
+
 class DualServerLauncher:
     """Manages both MCP and HTTP API servers."""
     
@@ -28,6 +53,7 @@ class DualServerLauncher:
                  mcp_port: int = None,
                  api_host: str = None, 
                  api_port: int = None,
+                 api_workers: int = None,
                  log_level: str = None):
         # Use configuration defaults if not provided
         config = get_config()
@@ -35,107 +61,160 @@ class DualServerLauncher:
         self.mcp_port = mcp_port or config.server.mcp_port
         self.api_host = api_host or config.server.api_host
         self.api_port = api_port or config.server.api_port
+        self.api_workers = api_workers or config.server.api_workers
         self.log_level = log_level or config.server.log_level
         self.mcp_server = None
         self.api_server = None
-        self.executor = ThreadPoolExecutor(max_workers=2)
-        self.shutdown_event = threading.Event()
+        self.api_process: Optional[asyncio.subprocess.Process] = None
+        self.shutdown_event: Optional[asyncio.Event] = None
         
+    def _request_shutdown(self, signum: int) -> None:
+        """Signal handler: ask both servers to exit."""
+        logger.info(f"Received signal {signum}, initiating shutdown...")
+        self.shutdown_event.set()
+
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating shutdown...")
-            self.shutdown_event.set()
-            
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        """Setup signal handlers for graceful shutdown on the running loop."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown, sig)
+            except NotImplementedError:
+                # Windows event loops do not support add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(self._request_shutdown, signum))
     
-    def run_mcp_server(self):
+    async def run_mcp_server(self):
         """Run the MCP server using FastMCP."""
         try:
             logger.info(f"Starting MCP server on {self.mcp_host}:{self.mcp_port}")
             
-            # Create the MCP server
-            mcp = create_gmail_mcp_server()
+            import uvicorn
+            from .mcp.fastmcp_server import create_gmail_mcp_server
             
-            # Run the MCP server
-            mcp.run(
-                transport="sse",
+            # Create the MCP server and serve its SSE app on the shared loop
+            mcp = create_gmail_mcp_server()
+            config = uvicorn.Config(
+                app=mcp.http_app(path="/mcp", transport="sse"),
                 host=self.mcp_host,
                 port=self.mcp_port,
-                path="/mcp"
+                log_level=self.log_level,
+                loop="none",
+                lifespan="on",
+                # SSE streams never finish on their own; don't wait for them
+                timeout_graceful_shutdown=0
             )
             
-        except Exception as e:
+            self.mcp_server = _create_uvicorn_server(config)
+            if not self.shutdown_event.is_set():
+                await self.mcp_server.serve()
+            
+        except (Exception, SystemExit) as e:
+            # uvicorn raises SystemExit when it cannot bind its port
             logger.error(f"Error running MCP server: {e}")
-            self.shutdown_event.set()
     
-    def run_api_server(self):
+    async def run_api_server(self):
         """Run the FastAPI HTTP server."""
         try:
             logger.info(f"Starting HTTP API server on {self.api_host}:{self.api_port}")
             
+            if self.api_workers > 1:
+                if os.getenv('GMAIL_MCP_PASSWORD'):
+                    await self._run_api_workers()
+                    return
+                # Worker processes cannot share a password prompt
+                logger.warning("GMAIL_MCP_PASSWORD is not set; running the HTTP API "
+                               "in-process instead of with worker processes")
+            
+            import uvicorn
+            from .api.rest_server import app as fastapi_app
+            
             # Configure uvicorn
             config = uvicorn.Config(
                 app=fastapi_app,
                 host=self.api_host,
                 port=self.api_port,
                 log_level=self.log_level,
-                access_log=True
+                access_log=True,
+                loop="none"
             )
             
-            server = uvicorn.Server(config)
-            server.run()
+            self.api_server = _create_uvicorn_server(config)
+            if not self.shutdown_event.is_set():
+                await self.api_server.serve()
             
-        except Exception as e:
+        except (Exception, SystemExit) as e:
             logger.error(f"Error running API server: {e}")
-            self.shutdown_event.set()
+
+    async def _run_api_workers(self):
+        """
+        Run the HTTP API as a uvicorn worker pool in a child process.
+        
+        uvicorn binds the port once and shares the socket across its worker
+        processes, so requests spread over all cores. Each worker holds its
+        own Gmail connector and message cache, and reads the credentials
+        password from GMAIL_MCP_PASSWORD.
+        """
+        logger.info(f"Running HTTP API with {self.api_workers} worker processes")
+        
+        # Directory containing the gmail_llm package
+        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        python_path = os.pathsep.join(filter(None, [app_dir, os.getenv('PYTHONPATH')]))
+        # Launch through gmail-api-server so the workers get the structured
+        # logging config rather than uvicorn's default
+        self.api_process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "gmail_llm.cli.api_server",
+            "--host", self.api_host,
+            "--port", str(self.api_port),
+            "--workers", str(self.api_workers),
+            "--log-level", self.log_level,
+            env={**os.environ, "PYTHONPATH": python_path}
+        )
+        if self.shutdown_event.is_set():
+            # Shutdown was requested while the process was starting
+            self.api_process.terminate()
+        returncode = await self.api_process.wait()
+        if returncode != 0 and not self.shutdown_event.is_set():
+            logger.error(f"HTTP API workers exited with code {returncode}")
+
+    async def _wait_shutdown(self):
+        """Wait for a signal or a server failure, then stop both servers."""
+        await self.shutdown_event.wait()
+        logger.info("Shutting down servers...")
+        for server in (self.mcp_server, self.api_server):
+            if server is not None:
+                server.should_exit = True
+        if self.api_process is not None and self.api_process.returncode is None:
+            self.api_process.terminate()
+
+    async def _main(self):
+        """Run both servers as tasks on the current event loop."""
+        self.shutdown_event = asyncio.Event()
+        self.setup_signal_handlers()
+        
+        mcp_task = asyncio.create_task(self.run_mcp_server(), name="mcp-server")
+        api_task = asyncio.create_task(self.run_api_server(), name="api-server")
+        # Either server stopping, for whatever reason, takes the other down
+        for task in (mcp_task, api_task):
+            task.add_done_callback(lambda _: self.shutdown_event.set())
+        
+        await self._wait_shutdown()
+        await asyncio.gather(mcp_task, api_task)
     
     def start_servers(self):
         """Start both servers concurrently."""
-        self.setup_signal_handlers()
-        
         logger.info("Starting Gmail LLM Dual Server...")
         logger.info(f"MCP Server will be available at: http://{self.mcp_host}:{self.mcp_port}/mcp")
         logger.info(f"HTTP API Server will be available at: http://{self.api_host}:{self.api_port}")
         logger.info(f"API Documentation will be available at: http://{self.api_host}:{self.api_port}/docs")
         
-        # Start MCP server in thread
-        mcp_future = self.executor.submit(self.run_mcp_server)
-        
-        # Start API server in thread  
-        api_future = self.executor.submit(self.run_api_server)
-        
+        # uvloop drives both servers; uvicorn is configured with loop="none"
+        # so it serves on whichever loop is already running
+        run = uvloop.run if uvloop is not None else asyncio.run
         try:
-            # Wait for shutdown signal
-            while not self.shutdown_event.is_set():
-                # Check if either server has crashed
-                if mcp_future.done():
-                    if mcp_future.exception():
-                        logger.error(f"MCP server crashed: {mcp_future.exception()}")
-                        break
-                        
-                if api_future.done():
-                    if api_future.exception():
-                        logger.error(f"API server crashed: {api_future.exception()}")
-                        break
-                        
-                self.shutdown_event.wait(1)  # Check every second
-                
+            run(self._main())
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
-        
         finally:
-            logger.info("Shutting down servers...")
-            self.shutdown_event.set()
-            
-            # Cancel futures
-            mcp_future.cancel()
-            api_future.cancel()
-            
-            # Shutdown executor
-            self.executor.shutdown(wait=True, timeout=10)
-            
             logger.info("Servers shutdown complete")
 
 def main():
@@ -148,6 +227,7 @@ def main():
     parser.add_argument("--mcp-port", type=int, default=config.server.mcp_port, help="MCP server port")
     parser.add_argument("--api-host", default=config.server.api_host, help="HTTP API server host")
     parser.add_argument("--api-port", type=int, default=config.server.api_port, help="HTTP API server port")
+    parser.add_argument("--api-workers", type=int, default=config.server.api_workers, help="HTTP API worker processes")
     parser.add_argument("--log-level", default=config.server.log_level, help="Log level")
     
     args = parser.parse_args()
@@ -165,6 +245,7 @@ def main():
         mcp_port=args.mcp_port,
         api_host=args.api_host,
         api_port=args.api_port,
+        api_workers=args.api_workers,
         log_level=args.log_level
     )
     
@@ -5,14 +5,23 @@ Eliminates code duplication in error handling and logging.
 
 import logging
 import functools
-import uuid
-from datetime import datetime
+import os
+import re
+import time
 from typing import Dict, Any, Callable, Optional
 
+from anyio import to_thread
+
 from .gmail_factory import get_gmail_connector
+from .logging_config import correlation_id_var
 
 logger = logging.getLogger(__name__)
 
+# Error messages that indicate the connector needs to re-authenticate
+_AUTH_ERR_RE = re.compile(r"authentication|unauthorized|credentials", re.IGNORECASE)
+
+_strip = str.strip
+
 
 def gmail_operation(operation_name: str, 
                    include_connector: bool = True,
@@ -29,17 +38,18 @@ def gmail_operation(operation_name: str,
         include_connector: If True, inject connector as first argument
         log_result: If True, log successful operation results
     """
+    # The start record's extra fields never change, so build them once
+    started_extra = {"operation": operation_name}
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Dict[str, Any]:
-            correlation_id = str(uuid.uuid4())[:8]
-            start_time = datetime.utcnow()
+            correlation_id = os.urandom(4).hex()
+            token = correlation_id_var.set(correlation_id)
+            start_time = time.perf_counter()
             
-            logger.info(f"{operation_name} started", extra={
-                "operation": operation_name,
-                "correlation_id": correlation_id,
-                "timestamp": start_time.isoformat()
-            })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s started", operation_name, extra=started_extra)
             
             try:
                 # Inject Gmail connector if requested
@@ -50,24 +60,21 @@ def gmail_operation(operation_name: str,
                     result = func(*args, **kwargs)
                 
                 # Log successful completion
-                if log_result:
-                    duration = (datetime.utcnow() - start_time).total_seconds()
-                    logger.info(f"{operation_name} completed successfully", extra={
+                if log_result and logger.isEnabledFor(logging.INFO):
+                    logger.info("%s completed successfully", operation_name, extra={
                         "operation": operation_name,
-                        "correlation_id": correlation_id,
-                        "duration_seconds": duration,
+                        "duration_seconds": time.perf_counter() - start_time,
                         "success": True
                     })
                 
                 return result
                 
             except Exception as e:
-                duration = (datetime.utcnow() - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 error_msg = f"Error in {operation_name}: {str(e)}"
                 
                 logger.error(error_msg, extra={
                     "operation": operation_name,
-                    "correlation_id": correlation_id,
                     "duration_seconds": duration,
                     "success": False,
                     "error": str(e),
@@ -81,57 +88,75 @@ def gmail_operation(operation_name: str,
                     "correlation_id": correlation_id,
                     "error_type": type(e).__name__
                 }
+            
+            finally:
+                correlation_id_var.reset(token)
         
         return wrapper
     return decorator
 
 
+def run_in_thread(func: Callable) -> Callable:
+    """
+    Decorator that turns a blocking function into a coroutine run on a worker thread.
+    
+    FastMCP calls sync tools inline on the event loop, so a slow Gmail call
+    would stall every other request served by that loop.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await to_thread.run_sync(functools.partial(func, *args, **kwargs))
+    return wrapper
+
+
 def http_operation(operation_name: str):
     """
     Decorator for HTTP API operations that provides:
-    - Request correlation IDs
+    - Request correlation IDs (reusing the one set by CorrelationMiddleware)
     - Performance logging
     - Standardized error responses
     """
+    started_extra = {"operation": operation_name, "type": "http_request"}
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            correlation_id = str(uuid.uuid4())[:8]
-            start_time = datetime.utcnow()
+            # CorrelationMiddleware normally set the request's ID already
+            token = None
+            if correlation_id_var.get() is None:
+                token = correlation_id_var.set(os.urandom(4).hex())
+            start_time = time.perf_counter()
             
-            logger.info(f"HTTP {operation_name} started", extra={
-                "operation": operation_name,
-                "correlation_id": correlation_id,
-                "timestamp": start_time.isoformat(),
-                "type": "http_request"
-            })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("HTTP %s started", operation_name, extra=started_extra)
             
             try:
                 result = await func(*args, **kwargs)
                 
-                duration = (datetime.utcnow() - start_time).total_seconds()
-                logger.info(f"HTTP {operation_name} completed", extra={
-                    "operation": operation_name,
-                    "correlation_id": correlation_id,
-                    "duration_seconds": duration,
-                    "success": True,
-                    "type": "http_response"
-                })
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("HTTP %s completed", operation_name, extra={
+                        "operation": operation_name,
+                        "duration_seconds": time.perf_counter() - start_time,
+                        "success": True,
+                        "type": "http_response"
+                    })
                 
                 return result
                 
             except Exception as e:
-                duration = (datetime.utcnow() - start_time).total_seconds()
-                logger.error(f"HTTP {operation_name} failed", extra={
+                logger.error("HTTP %s failed", operation_name, extra={
                     "operation": operation_name,
-                    "correlation_id": correlation_id,
-                    "duration_seconds": duration,
+                    "duration_seconds": time.perf_counter() - start_time,
                     "success": False,
                     "error": str(e),
                     "error_type": type(e).__name__,
                     "type": "http_error"
                 })
                 raise
+            
+            finally:
+                if token is not None:
+                    correlation_id_var.reset(token)
         
         return wrapper
     return decorator
@@ -156,12 +181,9 @@ def retry_on_auth_failure(max_retries: int = 1):
                     last_exception = e
                     
                     # Check if this is an auth-related error that we should retry
-                    if (attempt < max_retries and 
-                        ("authentication" in str(e).lower() or 
-                         "unauthorized" in str(e).lower() or
-                         "credentials" in str(e).lower())):
+                    if attempt < max_retries and _AUTH_ERR_RE.search(str(e)):
                         
-                        logger.warning(f"Authentication failure on attempt {attempt + 1}, retrying...", extra={
+                        logger.warning("Authentication failure on attempt %d, retrying...", attempt + 1, extra={
                             "attempt": attempt + 1,
                             "max_retries": max_retries,
                             "error": str(e)
@@ -192,7 +214,8 @@ def validate_message_ids(func: Callable) -> Callable:
         if 'message_ids' in kwargs:
             message_ids = kwargs['message_ids']
             if isinstance(message_ids, str):
-                id_list = [msg_id.strip() for msg_id in message_ids.split(",") if msg_id.strip()]
+                # Lists pass through untouched; strings are split and stripped once
+                id_list = list(filter(None, map(_strip, message_ids.split(","))))
                 if not id_list:
                     return {
                         "success": False,
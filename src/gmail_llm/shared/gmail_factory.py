@@ -1,14 +1,17 @@
 """
 Gmail connector factory for centralized Gmail connection management.
-Implements singleton pattern to ensure single authenticated connection.
+Keeps a single process-wide factory to ensure one authenticated connection.
 """
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from threading import Lock
 
-from ..core.gmail_connector import GmailConnector
 from ..config import get_config
+from .token_refresher import TokenRefresher
+
+if TYPE_CHECKING:
+    from ..core.gmail_connector import GmailConnector
 
 logger = logging.getLogger(__name__)
 
@@ -16,21 +19,15 @@ logger = logging.getLogger(__name__)
 class GmailConnectorFactory:
     """
     Factory for creating and managing Gmail connector instances.
-    Implements singleton pattern to reuse authenticated connections.
+    Reuses one authenticated connection; get_gmail_connector() holds the
+    process-wide instance.
     """
     
-    _instance: Optional['GmailConnectorFactory'] = None
-    _lock = Lock()
-    _connector: Optional[GmailConnector] = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(self):
+        self._lock = Lock()
+        self._connector: Optional['GmailConnector'] = None
     
-    def get_connector(self, force_recreate: bool = False) -> GmailConnector:
+    def get_connector(self, force_recreate: bool = False) -> 'GmailConnector':
         """
         Get an authenticated Gmail connector instance.
         
@@ -43,12 +40,21 @@ class GmailConnectorFactory:
         Raises:
             RuntimeError: If Gmail authentication fails
         """
+        # Fast path: a single attribute read, no lock, while the connector is good
+        connector = self._connector
+        if (connector is not None and
+                not force_recreate and
+                connector.is_authenticated()):
+            return connector
+        
         with self._lock:
+            # Re-check: another thread may have recreated it while we waited
             if (self._connector is None or 
                 force_recreate or 
                 not self._connector.is_authenticated()):
                 
                 logger.info("Creating new Gmail connector instance")
+                from ..core.gmail_connector import GmailConnector
                 config = get_config()
                 
                 try:
@@ -69,6 +75,10 @@ class GmailConnectorFactory:
             
             return self._connector
     
+    def current(self) -> Optional['GmailConnector']:
+        """Return the current connector without creating one."""
+        return self._connector
+    
     def is_authenticated(self) -> bool:
         """Check if the current connector is authenticated."""
         return (self._connector is not None and 
@@ -81,11 +91,12 @@ class GmailConnectorFactory:
             self._connector = None
 
 
-# Global factory instance
+# Global factory instance, created on first use
 _factory: Optional[GmailConnectorFactory] = None
+_factory_lock = Lock()
 
 
-def get_gmail_connector(force_recreate: bool = False) -> GmailConnector:
+def get_gmail_connector(force_recreate: bool = False) -> 'GmailConnector':
     """
     Convenience function to get a Gmail connector instance.
     
@@ -97,7 +108,9 @@ def get_gmail_connector(force_recreate: bool = False) -> GmailConnector:
     """
     global _factory
     if _factory is None:
-        _factory = GmailConnectorFactory()
+        with _factory_lock:
+            if _factory is None:
+                _factory = GmailConnectorFactory()
     
     return _factory.get_connector(force_recreate=force_recreate)
 
@@ -106,4 +119,34 @@ def reset_gmail_connector():
     """Reset the Gmail connector factory."""
     global _factory
     if _factory is not None:
-        _factory.reset()
\ No newline at end of file
+        _factory.reset()
+
+
+# Background refresher for the shared connector's OAuth token
+_token_refresher: Optional[TokenRefresher] = None
+
+
+def _current_auth_manager():
+    """Auth manager of the shared connector, if one has been created."""
+    connector = _factory.current() if _factory is not None else None
+    return connector.auth_manager if connector is not None else None
+
+
+def start_token_refresh() -> TokenRefresher:
+    """
+    Start refreshing the shared connector's OAuth token in the background.
+    Safe to call more than once; the refresher is created and started once.
+    
+    Returns:
+        The shared TokenRefresher instance
+    """
+    global _token_refresher
+    if _token_refresher is None:
+        _token_refresher = TokenRefresher(_current_auth_manager)
+    _token_refresher.start()
+    return _token_refresher
+
+
+def get_token_refresher() -> Optional[TokenRefresher]:
+    """Get the shared token refresher, or None if it has not been started."""
+    return _token_refresher
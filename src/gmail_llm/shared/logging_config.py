@@ -3,13 +3,105 @@ Structured logging configuration for Gmail LLM application.
 Provides consistent logging format and correlation tracking.
 """
 
+import copy
 import logging
 import logging.config
+import os
 import sys
-from typing import Dict, Any
+from contextvars import ContextVar
+from typing import Dict, Any, Optional
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+
+# LogRecord attributes that are not copied into the structured output
+_RESERVED = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created', 'msecs',
+    'relativeCreated', 'thread', 'threadName', 'processName',
+    'process', 'stack_info', 'exc_info', 'exc_text', 'getMessage'
+})
+
+
+# Correlation ID of the operation or request being handled in this context;
+# set by the decorators and copied onto every record by CorrelationFilter
+correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+
+class CorrelationFilter(logging.Filter):
+    """Attach the current correlation ID to each log record."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id_var.get()
+        return True
+
+
+class CorrelationMiddleware:
+    """
+    ASGI middleware that gives each HTTP request one correlation ID.
+    
+    Uses the client's X-Request-ID header when present, otherwise mints an ID;
+    the ID is set in correlation_id_var for the request and echoed back in the
+    response's X-Request-ID header.
+    """
+    
+    HEADER = b"x-request-id"
+    # Longer client-supplied IDs are replaced rather than copied into every log line
+    MAX_ID_LENGTH = 64
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        correlation_id = None
+        for name, value in scope["headers"]:
+            if name == self.HEADER:
+                if 0 < len(value) <= self.MAX_ID_LENGTH:
+                    correlation_id = value.decode("latin-1")
+                break
+        if correlation_id is None:
+            correlation_id = os.urandom(4).hex()
+        
+        response_header = (self.HEADER, correlation_id.encode("latin-1"))
+        
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), response_header]
+            await send(message)
+        
+        token = correlation_id_var.set(correlation_id)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            correlation_id_var.reset(token)
+
+
+def _json_default(value: Any) -> str:
+    """Stdlib json fallback for values orjson would serialize natively."""
+    if isinstance(value, datetime):
+        return value.isoformat() + "Z"
+    return str(value)
+
+
+def _dumps(log_data: Dict[str, Any]) -> str:
+    """Serialize a structured log record to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(
+            log_data,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(log_data, default=_json_default)
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -21,7 +113,8 @@ class StructuredFormatter(logging.Formatter):
         
         # Base log data
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Time the record was created, not when it reached the formatter
+            "timestamp": datetime.utcfromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -31,132 +124,143 @@ class StructuredFormatter(logging.Formatter):
         }
         
         # Add extra fields from record
-        if hasattr(record, '__dict__'):
-            for key, value in record.__dict__.items():
-                if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                              'filename', 'module', 'lineno', 'funcName', 'created', 'msecs',
-                              'relativeCreated', 'thread', 'threadName', 'processName', 
-                              'process', 'stack_info', 'exc_info', 'exc_text', 'getMessage']:
-                    log_data[key] = value
+        log_data.update({key: value for key, value in record.__dict__.items()
+                         if key not in _RESERVED})
         
         # Add exception info if present
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            # Cache the traceback on the record, as logging.Formatter does, so
+            # other handlers seeing the same record don't format it again
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
         
         # Add stack info if present
         if record.stack_info:
             log_data["stack_info"] = record.stack_info
             
-        return json.dumps(log_data, default=str)
+        return _dumps(log_data)
 
 
-def setup_logging(log_level: str = "info", 
-                 structured: bool = True,
-                 correlation_enabled: bool = True) -> None:
+# dictConfig templates; setup_logging copies one and fills in the level
+# wherever it is None
+_STRUCTURED_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "structured": {
+            "()": StructuredFormatter,
+        },
+        "simple": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "level": None,
+            "formatter": "structured",
+            "stream": "ext://sys.stdout"
+        }
+    },
+    "loggers": {
+        "gmail_llm": {
+            "level": None,
+            "handlers": ["console"],
+            "propagate": False
+        },
+        "fastmcp": {
+            "level": "WARNING",  # Reduce noise from FastMCP
+            "handlers": ["console"],
+            "propagate": False
+        },
+        "uvicorn": {
+            "level": "INFO",
+            "handlers": ["console"],
+            "propagate": False
+        },
+        "uvicorn.access": {
+            "level": "INFO",
+            "handlers": ["console"],
+            "propagate": False
+        }
+    },
+    "root": {
+        "level": None,
+        "handlers": ["console"]
+    }
+}
+
+# Simple console logging for development
+_SIMPLE_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "simple": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "level": None,
+            "formatter": "simple",
+            "stream": "ext://sys.stdout"
+        }
+    },
+    "root": {
+        "level": None,
+        "handlers": ["console"]
+    }
+}
+
+
+def build_logging_config(log_level: str = "info",
+                         structured: bool = True,
+                         correlation_enabled: bool = True) -> Dict[str, Any]:
     """
-    Setup application logging configuration.
+    Build the dictConfig used by setup_logging.
+    
+    Also passed to uvicorn as log_config so that worker processes, which
+    never run setup_logging themselves, log the same way as the parent.
     
     Args:
         log_level: Logging level (debug, info, warning, error)
         structured: Whether to use structured JSON logging
         correlation_enabled: Whether to enable correlation ID tracking
+        
+    Returns:
+        Logging configuration dictionary
     """
+    level = log_level.upper()
+    config = copy.deepcopy(_STRUCTURED_CONFIG_TEMPLATE if structured else _SIMPLE_CONFIG_TEMPLATE)
     
-    # Convert string level to logging constant
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
-    if structured:
-        # Structured JSON logging configuration
-        config = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "structured": {
-                    "()": StructuredFormatter,
-                },
-                "simple": {
-                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                }
-            },
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "level": log_level.upper(),
-                    "formatter": "structured" if structured else "simple",
-                    "stream": "ext://sys.stdout"
-                }
-            },
-            "loggers": {
-                "gmail_llm": {
-                    "level": log_level.upper(),
-                    "handlers": ["console"],
-                    "propagate": False
-                },
-                "fastmcp": {
-                    "level": "WARNING",  # Reduce noise from FastMCP
-                    "handlers": ["console"],
-                    "propagate": False
-                },
-                "uvicorn": {
-                    "level": "INFO",
-                    "handlers": ["console"],
-                    "propagate": False
-                },
-                "uvicorn.access": {
-                    "level": "INFO",
-                    "handlers": ["console"],
-                    "propagate": False
-                }
-            },
-            "root": {
-                "level": log_level.upper(),
-                "handlers": ["console"]
-            }
-        }
-    else:
-        # Simple console logging for development
-        config = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "simple": {
-                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                }
-            },
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "level": log_level.upper(),
-                    "formatter": "simple",
-                    "stream": "ext://sys.stdout"
-                }
-            },
-            "root": {
-                "level": log_level.upper(),
-                "handlers": ["console"]
-            }
-        }
-    
-    logging.config.dictConfig(config)
+    for section in (config["handlers"], config.get("loggers", {})):
+        for entry in section.values():
+            if entry["level"] is None:
+                entry["level"] = level
+    config["root"]["level"] = level
     
     # Add correlation tracking if enabled
     if correlation_enabled:
-        setup_correlation_tracking()
+        config["filters"] = {"correlation": {"()": CorrelationFilter}}
+        config["handlers"]["console"]["filters"] = ["correlation"]
+    
+    return config
 
 
-def setup_correlation_tracking():
-    """Setup correlation ID tracking for request tracing."""
-    
-    # Add custom log adapter for correlation
-    class CorrelationAdapter(logging.LoggerAdapter):
-        def process(self, msg, kwargs):
-            # Add correlation ID from context if available
-            if hasattr(self.extra, 'correlation_id'):
-                return f"[{self.extra['correlation_id']}] {msg}", kwargs
-            return msg, kwargs
+def setup_logging(log_level: str = "info", 
+                 structured: bool = True,
+                 correlation_enabled: bool = True) -> None:
+    """
+    Setup application logging configuration.
     
-    # This would be enhanced with actual correlation context management
-    # For now, it's a placeholder for future implementation
+    Args:
+        log_level: Logging level (debug, info, warning, error)
+        structured: Whether to use structured JSON logging
+        correlation_enabled: Whether to enable correlation ID tracking
+    """
+    logging.config.dictConfig(build_logging_config(log_level, structured, correlation_enabled))
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -172,6 +276,22 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Child loggers for the metric/event helpers, looked up once
+_performance_logger = logging.getLogger("gmail_llm.performance")
+_business_logger = logging.getLogger("gmail_llm.business")
+_security_logger = logging.getLogger("gmail_llm.security")
+
+_SECURITY_LOG_METHODS = {
+    "debug": _security_logger.debug,
+    "info": _security_logger.info,
+    "warning": _security_logger.warning,
+    "warn": _security_logger.warning,
+    "error": _security_logger.error,
+    "critical": _security_logger.critical,
+    "fatal": _security_logger.critical,
+}
+
+
 def log_performance(operation: str, duration: float, **extra_data):
     """
     Log performance metrics for operations.
@@ -181,8 +301,7 @@ def log_performance(operation: str, duration: float, **extra_data):
         duration: Duration in seconds
         **extra_data: Additional metrics to log
     """
-    logger = get_logger("gmail_llm.performance")
-    logger.info("Performance metric", extra={
+    _performance_logger.info("Performance metric", extra={
         "metric_type": "performance",
         "operation": operation,
         "duration_seconds": duration,
@@ -198,8 +317,7 @@ def log_business_event(event: str, **event_data):
         event: Event name
         **event_data: Event-specific data
     """
-    logger = get_logger("gmail_llm.business")
-    logger.info("Business event", extra={
+    _business_logger.info("Business event", extra={
         "event_type": "business",
         "event": event,
         **event_data
@@ -215,11 +333,13 @@ def log_security_event(event: str, severity: str = "info", **event_data):
         severity: Event severity (info, warning, error, critical)
         **event_data: Event-specific data
     """
-    logger = get_logger("gmail_llm.security")
-    log_method = getattr(logger, severity.lower(), logger.info)
+    log_method = _SECURITY_LOG_METHODS.get(severity)
+    if log_method is None:
+        # Other spellings and Logger method names resolve as they always have
+        log_method = getattr(_security_logger, severity.lower(), _security_logger.info)
     log_method("Security event", extra={
         "event_type": "security",
         "event": event,
         "severity": severity,
         **event_data
-    })
\ No newline at end of file
+    })
@@ -0,0 +1,105 @@
+"""
+Background OAuth token refresh for long-running servers.
+Refreshes credentials shortly before they expire so requests never pay for
+an expired-token round trip, and reports health when refresh keeps failing.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from ..auth.oauth_manager import OAuthManager
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefresher:
+    """
+    Refreshes OAuth credentials on a daemon thread ahead of their expiry.
+
+    After max_failures consecutive failed refreshes the ready event is
+    cleared so health checks report unhealthy; the next success sets it again.
+    """
+
+    def __init__(self,
+                 get_auth_manager: Callable[[], Optional['OAuthManager']],
+                 lead_time: float = 300,
+                 retry_interval: float = 60,
+                 max_failures: int = 3):
+        """
+        Initialize token refresher.
+
+        Args:
+            get_auth_manager: Returns the auth manager to keep fresh, or None if
+                no connector has authenticated yet
+            lead_time: Seconds before expiry at which to refresh
+            retry_interval: Seconds between checks when there is nothing to
+                refresh yet, and between retries after a failed refresh
+            max_failures: Consecutive failures before reporting unhealthy
+        """
+        self._get_auth_manager = get_auth_manager
+        self.lead_time = lead_time
+        self.retry_interval = retry_interval
+        self.max_failures = max_failures
+        self.consecutive_failures = 0
+        self.ready = threading.Event()
+        self.ready.set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def healthy(self) -> bool:
+        """Whether token refresh is currently succeeding."""
+        return self.ready.is_set()
+
+    def start(self) -> None:
+        """Start the refresh thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="gmail-token-refresh", daemon=True)
+        self._thread.start()
+        logger.info("Started background OAuth token refresh")
+
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _seconds_until_refresh(self, auth_manager: Optional['OAuthManager']) -> float:
+        """Seconds to wait before the next refresh attempt."""
+        credentials = auth_manager.credentials if auth_manager is not None else None
+        if credentials is None or credentials.expiry is None:
+            return self.retry_interval
+
+        # google-auth stores expiry as a naive UTC datetime
+        remaining = (credentials.expiry - datetime.utcnow()).total_seconds()
+        return max(0.0, remaining - self.lead_time)
+
+    def _run(self) -> None:
+        """Refresh loop; sleeps until shortly before each expiry."""
+        while not self._stop.is_set():
+            auth_manager = self._get_auth_manager()
+            delay = self._seconds_until_refresh(auth_manager)
+            if delay > 0:
+                # Re-evaluate after waiting: the connector may have been replaced
+                self._stop.wait(delay)
+                continue
+
+            if auth_manager.refresh_credentials():
+                self.consecutive_failures = 0
+                self.ready.set()
+            else:
+                self.consecutive_failures += 1
+                if self.consecutive_failures >= self.max_failures and self.ready.is_set():
+                    logger.error(
+                        f"OAuth token refresh failed {self.consecutive_failures} times in a row, "
+                        "reporting unhealthy"
+                    )
+                    self.ready.clear()
+                self._stop.wait(self.retry_interval)
@@ -3,8 +3,13 @@ Shared utility functions for Gmail LLM application.
 Eliminates code duplication for common operations.
 """
 
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+from email.utils import parseaddr
+from typing import List, Dict, Any, Optional, Tuple
+
+from email_validator import validate_email, EmailNotValidError
+
 from ..config import get_config
 
 logger = logging.getLogger(__name__)
@@ -26,7 +31,14 @@ def parse_message_ids(message_ids: str) -> List[str]:
     if not message_ids or not isinstance(message_ids, str):
         raise ValueError("Message IDs must be a non-empty string")
     
-    id_list = [msg_id.strip() for msg_id in message_ids.split(",") if msg_id.strip()]
+    # Single ID (the common case): no split, no second list
+    if "," not in message_ids:
+        message_id = message_ids.strip()
+        if not message_id:
+            raise ValueError("No valid message IDs provided")
+        return [message_id]
+    
+    id_list = [msg_id for msg_id in map(str.strip, message_ids.split(",")) if msg_id]
     
     if not id_list:
         raise ValueError("No valid message IDs provided")
@@ -34,21 +46,45 @@ def parse_message_ids(message_ids: str) -> List[str]:
     return id_list
 
 
-def parse_label_list(labels: str) -> Optional[List[str]]:
+@functools.lru_cache(maxsize=256)
+def _parse_label_string(labels: str) -> Optional[Tuple[str, ...]]:
+    """Split and clean a non-empty label string; cached per distinct string."""
+    if "," not in labels:
+        label = labels.strip()
+        return (label,) if label else None
+    
+    label_list = tuple(label for label in map(str.strip, labels.split(",")) if label)
+    return label_list if label_list else None
+
+
+def parse_label_list(labels: str) -> Optional[Tuple[str, ...]]:
     """
     Parse comma-separated label IDs.
     
+    Results are cached per input string, so clients that repeat the same
+    label filter skip the parse; use clear_label_cache() to reset.
+    
     Args:
         labels: Comma-separated string of label IDs
         
     Returns:
-        List of cleaned label IDs, or None if empty
+        Tuple of cleaned label IDs, or None if empty
     """
     if not labels or not isinstance(labels, str):
         return None
     
-    label_list = [label.strip() for label in labels.split(",") if label.strip()]
-    return label_list if label_list else None
+    return _parse_label_string(labels)
+
+
+def clear_label_cache() -> None:
+    """Clear the parse cache used by parse_label_list."""
+    _parse_label_string.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _max_results_limit() -> int:
+    """Configured max_results ceiling; cleared by reload_config()."""
+    return get_config().gmail.max_results_limit
 
 
 def validate_max_results(max_results: int) -> int:
@@ -64,20 +100,48 @@ def validate_max_results(max_results: int) -> int:
     Raises:
         ValueError: If max_results is invalid
     """
-    config = get_config()
-    
     if not isinstance(max_results, int):
         raise ValueError("max_results must be an integer")
     
     if max_results < 1:
         raise ValueError("max_results must be at least 1")
     
-    if max_results > config.gmail.max_results_limit:
-        raise ValueError(f"max_results cannot exceed {config.gmail.max_results_limit}")
+    limit = _max_results_limit()
+    if max_results > limit:
+        raise ValueError(f"max_results cannot exceed {limit}")
     
     return max_results
 
 
+def _formatted_email(email_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Map extracted message info onto the standardized email format."""
+    get = email_info.get
+    return {
+        "id": get("id", ""),
+        "thread_id": get("thread_id", ""),
+        "from": get("from", "Unknown"),
+        "to": get("to", "Unknown"), 
+        "subject": get("subject", "No Subject"),
+        "date": get("date", "Unknown"),
+        "snippet": get("snippet", ""),
+        "label_ids": get("label_ids", [])
+    }
+
+
+def _unparsed_email(raw_email: Dict[str, Any]) -> Dict[str, Any]:
+    """Placeholder entry for a message whose info could not be extracted."""
+    return {
+        "id": raw_email.get("id", ""),
+        "thread_id": raw_email.get("threadId", ""),
+        "from": "Unknown",
+        "to": "Unknown",
+        "subject": "Failed to parse",
+        "date": "Unknown",
+        "snippet": "Failed to parse email content",
+        "label_ids": []
+    }
+
+
 def format_email_info(raw_email: Dict[str, Any], connector) -> Dict[str, Any]:
     """
     Format raw email data into standardized format.
@@ -90,29 +154,36 @@ def format_email_info(raw_email: Dict[str, Any], connector) -> Dict[str, Any]:
         Formatted email information dictionary
     """
     try:
-        email_info = connector.extract_message_info(raw_email)
-        return {
-            "id": email_info.get("id", ""),
-            "thread_id": email_info.get("thread_id", ""),
-            "from": email_info.get("from", "Unknown"),
-            "to": email_info.get("to", "Unknown"), 
-            "subject": email_info.get("subject", "No Subject"),
-            "date": email_info.get("date", "Unknown"),
-            "snippet": email_info.get("snippet", ""),
-            "label_ids": email_info.get("label_ids", [])
-        }
+        return _formatted_email(connector.extract_message_info(raw_email))
     except Exception as e:
         logger.warning(f"Failed to format email info: {e}")
-        return {
-            "id": raw_email.get("id", ""),
-            "thread_id": raw_email.get("threadId", ""),
-            "from": "Unknown",
-            "to": "Unknown",
-            "subject": "Failed to parse",
-            "date": "Unknown",
-            "snippet": "Failed to parse email content",
-            "label_ids": []
-        }
+        return _unparsed_email(raw_email)
+
+
+def format_email_infos(raw_emails: List[Dict[str, Any]], connector) -> List[Dict[str, Any]]:
+    """
+    Format a list of raw emails into standardized format.
+    
+    Same output as calling format_email_info on each email, with the
+    connector's extractor looked up once for the whole batch.
+    
+    Args:
+        raw_emails: Raw email data from Gmail API
+        connector: Gmail connector instance for parsing
+        
+    Returns:
+        List of formatted email information dictionaries, in input order
+    """
+    extract = connector.extract_message_info
+    formatted = []
+    append = formatted.append
+    for raw_email in raw_emails:
+        try:
+            append(_formatted_email(extract(raw_email)))
+        except Exception as e:
+            logger.warning(f"Failed to format email info: {e}")
+            append(_unparsed_email(raw_email))
+    return formatted
 
 
 def create_bulk_operation_result(operation_name: str, 
@@ -129,7 +200,9 @@ def create_bulk_operation_result(operation_name: str,
     Returns:
         Standardized bulk operation result
     """
-    successful_count = sum(1 for result in results if result.get("success", False))
+    successful_count = 0
+    for result in results:
+        successful_count += result.get("success", False)
     failed_count = len(results) - successful_count
     
     return {
@@ -156,30 +229,67 @@ def sanitize_email_content(content: str, max_length: int = 1000) -> str:
     if not content:
         return ""
     
-    # Truncate if too long
-    if len(content) > max_length:
-        content = content[:max_length] + "..."
-    
     # Could add more sanitization rules here (e.g., remove email addresses, phone numbers)
-    return content
+    if len(content) <= max_length:
+        return content
+    
+    return content[:max_length] + "..."
+
+
+# RFC 5321 limit; email-validator rejects anything longer as well
+_MAX_EMAIL_LENGTH = 254
+# RFC 5322 line limit; bounds the display-name parse on hostile input
+_MAX_RECIPIENT_LENGTH = 998
+
+
+def _has_email_shape(email: str) -> bool:
+    """
+    Cheap local@domain.tld shape check that rejects obvious junk before the
+    full email-validator parse. Every step is a single linear scan, so
+    hostile input can't trigger backtracking.
+    """
+    if len(email) > _MAX_EMAIL_LENGTH or email.count("@") != 1:
+        return False
+    
+    # No whitespace anywhere
+    if email.split() != [email]:
+        return False
+    
+    local, _, domain = email.partition("@")
+    return bool(local) and "." in domain[1:-1]
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_email_address(email: str) -> bool:
+    """Syntax-check an address with email-validator (linear time, no DNS lookups)."""
+    try:
+        validate_email(email, check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
 
 
 def validate_email_address(email: str) -> bool:
     """
-    Basic email address validation.
+    Email address syntax validation.
+    
+    Accepts a bare address or one with a display name, e.g.
+    "Name <user@example.com>"; only the address part is checked.
     
     Args:
         email: Email address to validate
         
     Returns:
-        True if email appears valid
+        True if email is a syntactically valid address
     """
-    if not email or not isinstance(email, str):
+    if not email or not isinstance(email, str) or len(email) > _MAX_RECIPIENT_LENGTH:
         return False
     
-    # Basic validation - contains @ and has parts before and after
-    parts = email.split("@")
-    return len(parts) == 2 and len(parts[0]) > 0 and len(parts[1]) > 0 and "." in parts[1]
+    address = parseaddr(email)[1]
+    if not _has_email_shape(address):
+        return False
+    
+    return _is_valid_email_address(address)
 
 
 def create_success_response(message: str, **extra_data) -> Dict[str, Any]:
@@ -193,12 +303,9 @@ def create_success_response(message: str, **extra_data) -> Dict[str, Any]:
     Returns:
         Standardized success response
     """
-    response = {
-        "success": True,
-        "message": message
-    }
-    response.update(extra_data)
-    return response
+    if not extra_data:
+        return {"success": True, "message": message}
+    return {"success": True, "message": message, **extra_data}
 
 
 def create_error_response(message: str, 
@@ -217,6 +324,15 @@ def create_error_response(message: str,
     Returns:
         Standardized error response
     """
+    # Tool validation errors always pass both fields; build that shape directly
+    if operation and error_type and not extra_data:
+        return {
+            "success": False,
+            "message": message,
+            "operation": operation,
+            "error_type": error_type
+        }
+    
     response = {
         "success": False,
         "message": message
@@ -227,5 +343,6 @@ def create_error_response(message: str,
     if error_type:
         response["error_type"] = error_type
     
-    response.update(extra_data)
+    if extra_data:
+        response.update(extra_data)
     return response
\ No newline at end of file
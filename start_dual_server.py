@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 """
 Startup script for running both MCP and HTTP API servers.
+Installed as ``gmail-dual-server`` by ``pip install .``; this wrapper runs the same
+entry point from a source checkout.
 """
 
-import sys
+import importlib.util
 import os
+import sys
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+if importlib.util.find_spec("gmail_llm") is None:
+    # Package not installed: import it from the source tree
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 from gmail_llm.server_launcher import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()